@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
 import os
+import sqlite3
+import threading
+from datetime import date
 from io import BytesIO
 
 # ================== CONFIG ==================
@@ -14,89 +16,170 @@ PRICES = {
     "French Snooker Table": 250
 }
 
-# Excel file path
+# Table choices for the selectbox, built once instead of on every rerun
+TABLE_OPTIONS = tuple(PRICES)
+
+# Bookings database (SQLite) and the column order of a booking
+DB_FILE = "snooker_bookings.db"
+BOOKING_COLUMNS = ["Name", "Table", "Time", "Price", "Date"]
+
+# Files used by earlier versions; imported into DB_FILE on first run
+CSV_FILE = "snooker_bookings.csv"
 EXCEL_FILE = "snooker_bookings.xlsx"
 
+# Bookings shown in the All Bookings table unless the full list is requested
+RECENT_BOOKINGS_LIMIT = 100
+
+# Theme stylesheet, kept next to this script
+CSS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css")
+
+# ================== DATA ==================
+# One connection per server process, shared by all session threads. Its
+# transactions are shared too, so every use must hold the lock returned
+# alongside it. The date index keeps today's-revenue lookups off a full
+# table scan.
+@st.cache_resource
+def get_connection() -> tuple[sqlite3.Connection, threading.Lock]:
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+    lock = threading.Lock()
+    with lock:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS bookings (
+                name TEXT, table_name TEXT, time TEXT, price REAL, date TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_bookings_date ON bookings(date);
+        """)
+    return conn, lock
+
+# PRAGMA user_version once the legacy CSV/Excel import has been done
+LEGACY_IMPORTED = 1
+
+# One-time import of bookings saved by the CSV- or Excel-based versions.
+# Completion is recorded in PRAGMA user_version (in the same transaction as
+# the inserts), not inferred from the table being non-empty, so an import
+# that failed is retried on later runs even after new bookings are saved.
+# An empty legacy file, or none at all, counts as done. Returns the error
+# message when the file couldn't be read, for the caller to show.
+def import_legacy_bookings() -> str | None:
+    conn, lock = get_connection()
+    with lock:
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= LEGACY_IMPORTED:
+            return None
+        try:
+            if os.path.exists(CSV_FILE):
+                df = pd.read_csv(CSV_FILE)
+            elif os.path.exists(EXCEL_FILE):
+                # calamine is a much faster XLSX reader than openpyxl
+                df = pd.read_excel(EXCEL_FILE, engine="calamine")
+            else:
+                df = None
+        except pd.errors.EmptyDataError:
+            df = None
+        except Exception as e:
+            return str(e)
+        with conn:
+            if df is not None:
+                # Missing columns come through as empty values instead of a KeyError
+                df = df.reindex(columns=BOOKING_COLUMNS)
+                df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
+                df["Date"] = pd.to_datetime(df["Date"], errors="coerce").dt.strftime("%Y-%m-%d")
+                conn.executemany(
+                    "INSERT INTO bookings VALUES (?, ?, ?, ?, ?)",
+                    df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+                )
+            conn.execute(f"PRAGMA user_version = {LEGACY_IMPORTED}")
+    return None
+
+# Append one booking (in BOOKING_COLUMNS order); a single INSERT
+def append_row(row: tuple) -> None:
+    conn, lock = get_connection()
+    with lock, conn:
+        conn.execute("INSERT INTO bookings VALUES (?, ?, ?, ?, ?)", row)
+
+# Booking count, total revenue and revenue for `day` (YYYY-MM-DD), computed
+# in SQLite without materialising the table
+def booking_totals(day: str) -> tuple[int, float, float]:
+    conn, lock = get_connection()
+    with lock:
+        count, revenue = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(price), 0) FROM bookings"
+        ).fetchone()
+        (day_revenue,) = conn.execute(
+            "SELECT COALESCE(SUM(price), 0) FROM bookings WHERE date = ?", (day,)
+        ).fetchone()
+    return count, revenue, day_revenue
+
+# Read bookings into a DataFrame; `clause` is appended to the SELECT
+def _read_bookings(clause: str = "", params: tuple = ()) -> pd.DataFrame:
+    conn, lock = get_connection()
+    # Text columns go into Arrow-backed strings rather than per-cell Python objects
+    with lock:
+        df = pd.read_sql_query(
+            'SELECT name AS "Name", table_name AS "Table", time AS "Time", '
+            'price AS "Price", date AS "Date" FROM bookings ' + clause,
+            conn,
+            params=params,
+            dtype={"Name": "string[pyarrow]", "Table": "string[pyarrow]", "Time": "string[pyarrow]"}
+        )
+    # Always datetime64: an unparseable date becomes NaT instead of leaving
+    # the whole column as object dtype
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    return df
+
+# Streamlit reruns the whole script on every interaction, so keep the full
+# bookings table in memory for display and export. Bookings are only ever
+# appended, so the row count identifies the data version and is the cache key.
+@st.cache_data(show_spinner=False)
+def load_bookings(version: int) -> pd.DataFrame:
+    return _read_bookings()
+
+# The `limit` most recently saved bookings, newest first. The log is
+# append-only, so rowid order is save order; no full load or sort needed.
+@st.cache_data(show_spinner=False)
+def load_recent_bookings(version: int, limit: int) -> pd.DataFrame:
+    return _read_bookings("ORDER BY rowid DESC LIMIT ?", (limit,))
+
+# Excel export for the download button, serialised once per data version.
+# xlsxwriter is noticeably faster than openpyxl for writing.
+@st.cache_data(show_spinner=False)
+def bookings_xlsx_bytes(version: int) -> bytes:
+    buf = BytesIO()
+    # Date is datetime64; write it as a plain date rather than with 00:00:00
+    with pd.ExcelWriter(buf, engine="xlsxwriter", datetime_format="YYYY-MM-DD") as writer:
+        load_bookings(version).to_excel(writer, index=False)
+    return buf.getvalue()
+
+# ================== HELPERS ==================
+# Parse "hh:mm AM/PM" (case-insensitive) into minutes since midnight.
+# The format is fixed, so slicing it by hand is much cheaper than strptime.
+# For ASCII input it accepts exactly what strptime("%I:%M %p") accepts;
+# non-ASCII digits are always rejected. Raises ValueError on bad input.
+def _parse_hhmm_ampm(s: str) -> int:
+    hh, _, rest = s.strip().upper().partition(":")
+    parts = rest.split(None, 1)
+    if len(parts) != 2 or rest[:1].isspace():
+        raise ValueError(f"invalid time: {s!r}")
+    mm, ampm = parts[0], parts[1].strip()
+    # isascii(): isdigit() and int() also take non-ASCII digits, strptime doesn't
+    if not (hh.isascii() and mm.isascii() and hh.isdigit() and mm.isdigit()
+            and len(hh) <= 2 and len(mm) <= 2) or ampm not in ("AM", "PM"):
+        raise ValueError(f"invalid time: {s!r}")
+    h, m = int(hh), int(mm)
+    if not (1 <= h <= 12 and m <= 59):
+        raise ValueError(f"invalid time: {s!r}")
+    return (h % 12 + (12 if ampm == "PM" else 0)) * 60 + m
+
 # ================== CUSTOM CSS (THEME FIX) ==================
-# This robust CSS block applies the background image and gold/black theme
+# style.css applies the background image and gold/black theme
 # to the main Streamlit container (stApp) and internal elements.
-st.markdown("""
-    <style>
-    /* 1. Background Image and Dark Overlay Fix: Targeting the main Streamlit container */
-    /* This makes the background image visible and applies a dark filter */
-    .stApp {
-        background: url('https://images.unsplash.com/photo-1582120467325-5d9f96a7a5c3?auto=format&fit=crop&w=1920&q=80') no-repeat center center fixed;
-        background-size: cover;
-        position: relative;
-    }
-    .stApp::before {
-        content: "";
-        position: absolute; top:0; left:0; width:100%; height:100%;
-        background: rgba(0,0,0,0.75); /* Dark overlay */
-        z-index: 0;
-    }
-    
-    /* 2. General Text and Header Color */
-    .main, .stApp {
-        color: #f5c518 !important; /* Gold text color */
-        font-family: "Segoe UI", sans-serif;
-    }
-    h1, h2, h3, h4, h5, h6 {
-        color: #f5c518 !important; /* Make all headers gold */
-    }
-
-    /* 3. Input Fields (text_input, selectbox) Styling */
-    /* Targets the input boxes to give them a black background and gold border/text */
-    .stTextInput>div>div>input, 
-    .stTextArea>div>div>textarea, 
-    .stSelectbox>div>div {
-        background-color: #1a1a1a !important; 
-        color: #f5c518 !important; 
-        border: 1px solid #f5c518 !important; 
-        border-radius: 10px; 
-        padding: 8px;
-    }
-    
-    /* 4. Button Styling (Gold & Black) */
-    .stButton>button {
-        background: linear-gradient(90deg, #f5c518, #ffdf70);
-        color:black !important; border-radius:12px; padding:10px 20px;
-        font-weight:bold; border:none; box-shadow:0px 0px 10px rgba(245,197,24,0.6);
-        transition: all 0.2s ease-in-out;
-    }
-    .stButton>button:hover { 
-        background: linear-gradient(90deg, #ffdf70, #f5c518); 
-        transform:scale(1.02); 
-    }
-    
-    /* 5. Metrics/Stats Box Styling */
-    [data-testid="stMetric"] {
-        background-color: #1a1a1a;
-        border: 1px solid #f5c518;
-        border-radius: 10px;
-        padding: 15px;
-        box-shadow:0px 0px 10px rgba(245,197,24,0.3);
-        margin-bottom: 10px;
-    }
-    
-    /* Custom Box Class (for Booking Section and Quick Stats) */
-    .custom-box {
-        background-color:rgba(0,0,0,0.8); /* Slightly transparent black */
-        padding:20px; 
-        border-radius:15px;
-        border: 2px solid #f5c518; /* Gold border */
-        box-shadow: 0 0 15px rgba(245, 197, 24, 0.5); /* Gold glow */
-        z-index: 10;
-        position: relative; /* Ensure it stacks over the background */
-    }
-    
-    /* Ensure all content sits above the Z-index 0 background overlay */
-    .main [data-testid="stVerticalBlock"] {
-        z-index: 10 !important;
-    }
-    
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_data(show_spinner=False)
+def load_css() -> str:
+    with open(CSS_FILE, encoding="utf-8") as f:
+        return f.read()
+
+# Streamlit drops elements that aren't re-emitted on a rerun, so the
+# stylesheet is sent every time; only the file read is cached.
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 # ================== END CUSTOM CSS ==================
 
 
@@ -112,6 +195,19 @@ st.markdown(
 st.markdown("---")
 
 # ================== LAYOUT ==================
+# Today's date, taken once per run so Save and Quick Stats always agree
+# (even when a run straddles midnight)
+TODAY = date.today().isoformat()
+
+try:
+    legacy_error = import_legacy_bookings()
+    if legacy_error:
+        st.warning(f"⚠️ Skipped importing old bookings: {legacy_error}")
+    total_bookings, total_revenue, today_revenue = booking_totals(TODAY)
+except Exception as e:
+    st.error(f"⚠️ Could not load bookings: {e}")
+    total_bookings, total_revenue, today_revenue = 0, 0.0, 0.0
+
 col1, col2 = st.columns(2)
 
 # --- Booking Section ---
@@ -120,7 +216,7 @@ with col1:
     st.subheader("📝 Booking Section")
 
     name = st.text_input("Customer Name")
-    table = st.selectbox("Choose Table", list(PRICES.keys()))
+    table = st.selectbox("Choose Table", TABLE_OPTIONS)
     start_time = st.text_input("Enter Start Time (hh:mm AM/PM)", "02:00 PM")
     end_time = st.text_input("Enter End Time (hh:mm AM/PM)", "03:00 PM")
 
@@ -129,37 +225,32 @@ with col1:
             st.error("❌ Customer Name cannot be empty.")
         else:
             try:
-                # Convert times, making input case-insensitive for AM/PM
-                start_dt = datetime.strptime(start_time.strip().upper(), "%I:%M %p")
-                end_dt = datetime.strptime(end_time.strip().upper(), "%I:%M %p")
+                # Convert times to minutes since midnight
+                start_min = _parse_hhmm_ampm(start_time)
+                end_min = _parse_hhmm_ampm(end_time)
 
                 # Handle cross-midnight bookings
-                delta = end_dt - start_dt
-                if delta.total_seconds() < 0:
-                     delta += pd.Timedelta(days=1) 
-                     
-                if delta.total_seconds() <= 0:
+                delta_min = (end_min - start_min) % 1440
+
+                if delta_min == 0:
                     st.error("❌ End time must be after start time.")
                 else:
-                    hours = delta.total_seconds() / 3600
+                    hours = delta_min / 60
                     price = round(hours * PRICES[table], 2)
 
-                    # Load or create Excel
-                    if os.path.exists(EXCEL_FILE):
-                        df = pd.read_excel(EXCEL_FILE)
-                    else:
-                        df = pd.DataFrame(columns=["Name", "Table", "Time", "Price", "Date"])
-
-                    # Append booking
-                    new_row = {
-                        "Name": name.strip(),
-                        "Table": table,
-                        "Time": f"{start_time} - {end_time}",
-                        "Price": price,
-                        "Date": datetime.today().strftime("%Y-%m-%d")
-                    }
-                    df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-                    df.to_excel(EXCEL_FILE, index=False)
+                    # Append booking; the existing history is never read here
+                    append_row((
+                        name.strip(),
+                        table,
+                        f"{start_time} - {end_time}",
+                        price,
+                        TODAY
+                    ))
+                    load_bookings.clear()
+                    load_recent_bookings.clear()
+                    bookings_xlsx_bytes.clear()
+                    # Refresh so the sections below show the new booking
+                    total_bookings, total_revenue, today_revenue = booking_totals(TODAY)
 
                     st.success(f"✅ Booking saved! Total Price: ₹{price:,.2f}")
                     st.balloons() 
@@ -176,26 +267,14 @@ with col2:
     st.markdown("<div class='custom-box'>", unsafe_allow_html=True) 
     st.subheader("📊 Quick Stats")
 
-    if os.path.exists(EXCEL_FILE):
-        df = pd.read_excel(EXCEL_FILE)
-        df['Price'] = pd.to_numeric(df['Price'], errors='coerce').fillna(0) 
-        
-        total_bookings = len(df)
-        total_revenue = df["Price"].sum()
-        today_revenue = df[df["Date"] == datetime.today().strftime("%Y-%m-%d")]["Price"].sum()
-
+    if total_bookings:
         st.metric("Total Bookings", total_bookings)
         st.metric("Total Revenue", f"₹{total_revenue:,.2f}")
         st.metric("Today's Revenue", f"₹{today_revenue:,.2f}")
 
-        # Download button preparation
-        towrite = BytesIO()
-        df.to_excel(towrite, index=False, engine="openpyxl")
-        towrite.seek(0)
-        
         st.download_button(
             label="📥 Download Bookings Excel",
-            data=towrite,
+            data=bookings_xlsx_bytes(total_bookings),
             file_name="snooker_bookings.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         )
@@ -209,9 +288,23 @@ st.markdown("---")
 
 # --- Display existing bookings ---
 st.subheader("All Bookings")
-if os.path.exists(EXCEL_FILE):
-    df_all = pd.read_excel(EXCEL_FILE)
-    st.dataframe(df_all.sort_values(by="Date", ascending=False).reset_index(drop=True), use_container_width=True)
+if total_bookings:
+    # Show only the newest bookings by default, so the browser payload stays
+    # bounded; the full table is loaded only when asked for. Both views list
+    # bookings newest-saved first.
+    if st.toggle("Show all bookings"):
+        shown = load_bookings(total_bookings).iloc[::-1]
+    else:
+        shown = load_recent_bookings(total_bookings, RECENT_BOOKINGS_LIMIT)
+        if total_bookings > RECENT_BOOKINGS_LIMIT:
+            st.caption(f"Showing the {RECENT_BOOKINGS_LIMIT} most recent of {total_bookings} bookings.")
+
+    st.dataframe(
+        shown,
+        use_container_width=True,
+        hide_index=True,
+        column_config={"Date": st.column_config.DateColumn(format="YYYY-MM-DD")}
+    )
 else:
     st.info("No bookings saved yet.")
 
@@ -237,219 +330,4 @@ else:
 #         st.error(f"Failed to start ngrok: {e}")
 
 # if 'public_url' in st.session_state:
-#     st.markdown(f"**Public URL:** [{st.session_state['public_url']}]({st.session_state['public_url']})")import streamlit as st
-import pandas as pd
-from datetime import datetime
-import os
-from io import BytesIO
-
-# ================== CONFIG ==================
-st.set_page_config(page_title="Continental Snooker", page_icon="🎱", layout="wide")
-
-# Prices per hour
-PRICES = {
-    "English Snooker Table 1": 200,
-    "English Snooker Table 2": 200,
-    "French Snooker Table": 250
-}
-
-# Excel file path
-EXCEL_FILE = "snooker_bookings.xlsx"
-
-# ================== CUSTOM CSS (THEME FIX) ==================
-# This robust CSS block applies the background image and gold/black theme
-# to the main Streamlit container (stApp) and internal elements.
-st.markdown("""
-    <style>
-    /* 1. Background Image and Dark Overlay Fix: Targeting the main Streamlit container */
-    /* This makes the background image visible and applies a dark filter */
-    .stApp {
-        background: url('https://images.unsplash.com/photo-1582120467325-5d9f96a7a5c3?auto=format&fit=crop&w=1920&q=80') no-repeat center center fixed;
-        background-size: cover;
-        position: relative;
-    }
-    .stApp::before {
-        content: "";
-        position: absolute; top:0; left:0; width:100%; height:100%;
-        background: rgba(0,0,0,0.75); /* Dark overlay */
-        z-index: 0;
-    }
-    
-    /* 2. General Text and Header Color */
-    .main, .stApp {
-        color: #f5c518 !important; /* Gold text color */
-        font-family: "Segoe UI", sans-serif;
-    }
-    h1, h2, h3, h4, h5, h6 {
-        color: #f5c518 !important; /* Make all headers gold */
-    }
-
-    /* 3. Input Fields (text_input, selectbox) Styling */
-    /* Targets the input boxes to give them a black background and gold border/text */
-    .stTextInput>div>div>input, 
-    .stTextArea>div>div>textarea, 
-    .stSelectbox>div>div {
-        background-color: #1a1a1a !important; 
-        color: #f5c518 !important; 
-        border: 1px solid #f5c518 !important; 
-        border-radius: 10px; 
-        padding: 8px;
-    }
-    
-    /* 4. Button Styling (Gold & Black) */
-    .stButton>button {
-        background: linear-gradient(90deg, #f5c518, #ffdf70);
-        color:black !important; border-radius:12px; padding:10px 20px;
-        font-weight:bold; border:none; box-shadow:0px 0px 10px rgba(245,197,24,0.6);
-        transition: all 0.2s ease-in-out;
-    }
-    .stButton>button:hover { 
-        background: linear-gradient(90deg, #ffdf70, #f5c518); 
-        transform:scale(1.02); 
-    }
-    
-    /* 5. Metrics/Stats Box Styling */
-    [data-testid="stMetric"] {
-        background-color: #1a1a1a;
-        border: 1px solid #f5c518;
-        border-radius: 10px;
-        padding: 15px;
-        box-shadow:0px 0px 10px rgba(245,197,24,0.3);
-        margin-bottom: 10px;
-    }
-    
-    /* Custom Box Class (for Booking Section and Quick Stats) */
-    .custom-box {
-        background-color:rgba(0,0,0,0.8); /* Slightly transparent black */
-        padding:20px; 
-        border-radius:15px;
-        border: 2px solid #f5c518; /* Gold border */
-        box-shadow: 0 0 15px rgba(245, 197, 24, 0.5); /* Gold glow */
-        z-index: 10;
-        position: relative; /* Ensure it stacks over the background */
-    }
-    
-    /* Ensure all content sits above the Z-index 0 background overlay */
-    .main [data-testid="stVerticalBlock"] {
-        z-index: 10 !important;
-    }
-    
-    </style>
-""", unsafe_allow_html=True)
-# ================== END CUSTOM CSS ==================
-
-
-# ================== TITLE ==================
-st.markdown(
-    """
-    <h1 style='text-align:center;'>🏆 Continental Snooker 🎱</h1>
-    <h3 style='text-align:center;'>Welcome to Continental Snooker</h3>
-    """,
-    unsafe_allow_html=True
-)
-
-st.markdown("---")
-
-# ================== LAYOUT ==================
-col1, col2 = st.columns(2)
-
-# --- Booking Section ---
-with col1:
-    st.markdown("<div class='custom-box'>", unsafe_allow_html=True) 
-    st.subheader("📝 Booking Section")
-
-    name = st.text_input("Customer Name")
-    table = st.selectbox("Choose Table", list(PRICES.keys()))
-    start_time = st.text_input("Enter Start Time (hh:mm AM/PM)", "02:00 PM")
-    end_time = st.text_input("Enter End Time (hh:mm AM/PM)", "03:00 PM")
-
-    if st.button("💾 Save Booking"):
-        if not name.strip():
-            st.error("❌ Customer Name cannot be empty.")
-        else:
-            try:
-                # Convert times, making input case-insensitive for AM/PM
-                start_dt = datetime.strptime(start_time.strip().upper(), "%I:%M %p")
-                end_dt = datetime.strptime(end_time.strip().upper(), "%I:%M %p")
-
-                # Handle cross-midnight bookings
-                delta = end_dt - start_dt
-                if delta.total_seconds() < 0:
-                     delta += pd.Timedelta(days=1) 
-                     
-                if delta.total_seconds() <= 0:
-                    st.error("❌ End time must be after start time.")
-                else:
-                    hours = delta.total_seconds() / 3600
-                    price = round(hours * PRICES[table], 2)
-
-                    # Load or create Excel
-                    if os.path.exists(EXCEL_FILE):
-                        df = pd.read_excel(EXCEL_FILE)
-                    else:
-                        df = pd.DataFrame(columns=["Name", "Table", "Time", "Price", "Date"])
-
-                    # Append booking
-                    new_row = {
-                        "Name": name.strip(),
-                        "Table": table,
-                        "Time": f"{start_time} - {end_time}",
-                        "Price": price,
-                        "Date": datetime.today().strftime("%Y-%m-%d")
-                    }
-                    df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-                    df.to_excel(EXCEL_FILE, index=False)
-
-                    st.success(f"✅ Booking saved! Total Price: ₹{price:,.2f}")
-                    st.balloons() 
-
-            except ValueError: 
-                st.error("⚠️ Invalid time format. Please use hh:mm AM/PM (e.g., 02:30 PM).")
-            except Exception as e:
-                 st.error(f"⚠️ An unexpected error occurred: {e}")
-
-    st.markdown("</div>", unsafe_allow_html=True)
-
-# --- Quick Stats Section ---
-with col2:
-    st.markdown("<div class='custom-box'>", unsafe_allow_html=True) 
-    st.subheader("📊 Quick Stats")
-
-    if os.path.exists(EXCEL_FILE):
-        df = pd.read_excel(EXCEL_FILE)
-        df['Price'] = pd.to_numeric(df['Price'], errors='coerce').fillna(0) 
-        
-        total_bookings = len(df)
-        total_revenue = df["Price"].sum()
-        today_revenue = df[df["Date"] == datetime.today().strftime("%Y-%m-%d")]["Price"].sum()
-
-        st.metric("Total Bookings", total_bookings)
-        st.metric("Total Revenue", f"₹{total_revenue:,.2f}")
-        st.metric("Today's Revenue", f"₹{today_revenue:,.2f}")
-
-        # Download button preparation
-        towrite = BytesIO()
-        df.to_excel(towrite, index=False, engine="openpyxl")
-        towrite.seek(0)
-        
-        st.download_button(
-            label="📥 Download Bookings Excel",
-            data=towrite,
-            file_name="snooker_bookings.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
-
-    else:
-        st.info("No bookings yet!")
-
-    st.markdown("</div>", unsafe_allow_html=True)
-
-st.markdown("---") 
-
-# --- Display existing bookings ---
-st.subheader("All Bookings")
-if os.path.exists(EXCEL_FILE):
-    df_all = pd.read_excel(EXCEL_FILE)
-    st.dataframe(df_all.sort_values(by="Date", ascending=False).reset_index(drop=True), use_container_width=True)
-else:
-    st.info("No bookings saved yet.")
+#     st.markdown(f"**Public URL:** [{st.session_state['public_url']}]({st.session_state['public_url']})")